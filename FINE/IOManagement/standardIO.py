@@ -3,8 +3,10 @@ import FINE.utils as utils
 import pandas as pd
 import ast
 import inspect
+import os
 import time
 import warnings
+import openpyxl
 
 try:
     import geopandas as gpd
@@ -17,17 +19,14 @@ except ImportError:
     warnings.warn('Matplotlib.pyplot could not be imported.')
 
 
-def writeOptimizationOutputToExcel(esM, outputFileName='scenarioOutput', optSumOutputLevel=2, optValOutputLevel=1):
+def getOptimizationOutputFrames(esM, optSumOutputLevel=2, optValOutputLevel=1):
     """
-    Write optimization output to an Excel file.
+    Collect the optimization output of an optimized energy system model as a list of (sheet name, DataFrame)
+    tuples. The sheet names are the ones used in the Excel output of writeOptimizationOutputToExcel.
 
     :param esM: EnergySystemModel instance in which the optimized model is hold
     :type esM: EnergySystemModel instance
 
-    :param outputFileName: name of the Excel output file (without .xlsx ending)
-        |br| * the default value is 'scenarioOutput'
-    :type outputFileName: string
-
     :param optSumOutputLevel: output level of the optimization summary (see EnergySystemModel). Either an integer
         (0,1,2) which holds for all model classes or a dictionary with model class names as keys and an integer
         (0,1,2) for each key (e.g. {'StorageModel':1,'SourceSinkModel':1,...}
@@ -41,10 +40,11 @@ def writeOptimizationOutputToExcel(esM, outputFileName='scenarioOutput', optSumO
         - 1: Lines containing only zeroes are dropped.
         |br| * the default value is 1
     :type optValOutputLevel: int (0,1) or dict
+
+    :return: frames - list of (sheet name, DataFrame) tuples
+    :rtype: list
     """
-    utils.output('\nWriting output to Excel... ', esM.verbose, 0)
-    _t = time.time()
-    writer = pd.ExcelWriter(outputFileName + '.xlsx')
+    frames = []
 
     for name in esM.componentModelingDict.keys():
         utils.output('\tProcessing ' + name + ' ...', esM.verbose, 0)
@@ -52,7 +52,7 @@ def writeOptimizationOutputToExcel(esM, outputFileName='scenarioOutput', optSumO
         oL_ = oL[name] if type(oL) == dict else oL
         optSum = esM.getOptimizationSummary(name, outputLevel=oL_)
         if not optSum.empty:
-            optSum.to_excel(writer, name[:-5] + 'OptSummary_' + esM.componentModelingDict[name].dimension)
+            frames.append((name[:-5] + 'OptSummary_' + esM.componentModelingDict[name].dimension, optSum))
 
         data = esM.componentModelingDict[name].getOptimalValues()
         oL = optValOutputLevel
@@ -75,14 +75,14 @@ def writeOptimizationOutputToExcel(esM, outputFileName='scenarioOutput', optSumO
             if oL_ == 1:
                 dfTD1dim = dfTD1dim.loc[((dfTD1dim != 0) & (~dfTD1dim.isnull())).any(axis=1)]
             if not dfTD1dim.empty:
-                dfTD1dim.to_excel(writer, name[:-5] + '_TDoptVar_1dim')
+                frames.append((name[:-5] + '_TDoptVar_1dim', dfTD1dim))
         if dataTD2dim:
             names = ['Variable', 'Component', 'LocationIn', 'LocationOut']
             dfTD2dim = pd.concat(dataTD2dim, keys=indexTD2dim, names=names)
             if oL_ == 1:
                 dfTD2dim = dfTD2dim.loc[((dfTD2dim != 0) & (~dfTD2dim.isnull())).any(axis=1)]
             if not dfTD2dim.empty:
-                dfTD2dim.to_excel(writer, name[:-5] + '_TDoptVar_2dim')
+                frames.append((name[:-5] + '_TDoptVar_2dim', dfTD2dim))
         if dataTI:
             if esM.componentModelingDict[name].dimension == '1dim':
                 names = ['Variable type', 'Component']
@@ -92,15 +92,141 @@ def writeOptimizationOutputToExcel(esM, outputFileName='scenarioOutput', optSumO
             if oL_ == 1:
                 dfTI = dfTI.loc[((dfTI != 0) & (~dfTI.isnull())).any(axis=1)]
             if not dfTI.empty:
-                dfTI.to_excel(writer, name[:-5] + '_TIoptVar_' + esM.componentModelingDict[name].dimension)
+                frames.append((name[:-5] + '_TIoptVar_' + esM.componentModelingDict[name].dimension, dfTI))
 
     periodsOrder = pd.DataFrame([esM.periodsOrder], index=['periodsOrder'], columns=esM.periods)
-    periodsOrder.to_excel(writer, 'Misc')
+    frames.append(('Misc', periodsOrder))
+
+    return frames
+
+
+def writeOptimizationOutputToExcel(esM, outputFileName='scenarioOutput', optSumOutputLevel=2, optValOutputLevel=1,
+                                   writeOnly=False):
+    """
+    Write optimization output to an Excel file.
+
+    :param esM: EnergySystemModel instance in which the optimized model is hold
+    :type esM: EnergySystemModel instance
+
+    :param outputFileName: name of the Excel output file (without .xlsx ending)
+        |br| * the default value is 'scenarioOutput'
+    :type outputFileName: string
+
+    :param optSumOutputLevel: output level of the optimization summary (see EnergySystemModel). Either an integer
+        (0,1,2) which holds for all model classes or a dictionary with model class names as keys and an integer
+        (0,1,2) for each key (e.g. {'StorageModel':1,'SourceSinkModel':1,...}
+        |br| * the default value is 2
+    :type optSumOutputLevel: int (0,1,2) or dict
+
+    :param optValOutputLevel: output level of the optimal values. Either an integer (0,1) which holds for all
+        model classes or a dictionary with model class names as keys and an integer (0,1) for each key
+        (e.g. {'StorageModel':1,'SourceSinkModel':1,...}
+        - 0: all values are kept.
+        - 1: Lines containing only zeroes are dropped.
+        |br| * the default value is 1
+    :type optValOutputLevel: int (0,1) or dict
+
+    :param writeOnly: states if the file should be written with a write-only openpyxl workbook, which streams
+        the data row by row and is considerably faster for large models. Index entries are then not merged
+        and no cell formatting is applied; the file can still be read with readOptimizationOutputFromExcel.
+        |br| * the default value is False
+    :type writeOnly: boolean
+    """
+    utils.output('\nWriting output to Excel... ', esM.verbose, 0)
+    _t = time.time()
+    frames = getOptimizationOutputFrames(esM, optSumOutputLevel, optValOutputLevel)
     utils.output('\tSaving file...', esM.verbose, 0)
-    writer.save()
+    writeFramesToExcel(frames, outputFileName, writeOnly=writeOnly)
     utils.output('Done. (%.4f' % (time.time() - _t) + ' sec)', esM.verbose, 0)
 
 
+def writeFramesToExcel(frames, outputFileName='scenarioOutput', writeOnly=False):
+    """
+    Write a list of (sheet name, DataFrame) tuples, as obtained by getOptimizationOutputFrames, to an Excel file.
+
+    :param frames: list of (sheet name, DataFrame) tuples
+    :type frames: list
+
+    :param outputFileName: name of the Excel output file (without .xlsx ending)
+        |br| * the default value is 'scenarioOutput'
+    :type outputFileName: string
+
+    :param writeOnly: states if the file should be written with a write-only openpyxl workbook
+        (cf. writeOptimizationOutputToExcel).
+        |br| * the default value is False
+    :type writeOnly: boolean
+    """
+    if not writeOnly:
+        writer = pd.ExcelWriter(outputFileName + '.xlsx')
+        for sheetName, df in frames:
+            df.to_excel(writer, sheetName)
+        writer.save()
+        return
+
+    wb = openpyxl.Workbook(write_only=True)
+    for sheetName, df in frames:
+        ws = wb.create_sheet(title=sheetName)
+        # Unnamed index levels get an empty header cell (as done by pandas' to_excel)
+        header = [name if name is not None else '' for name in df.index.names] + list(df.columns)
+        df = df.reset_index()
+        # NaN values are written as empty cells (as done by pandas' to_excel)
+        df = df.astype(object).where(df.notnull(), None)
+        ws.append(header)
+        for row in df.itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(outputFileName + '.xlsx')
+
+
+def writeOptimizationOutputToParquet(esM, outputFolderName='scenarioOutput', optSumOutputLevel=2,
+                                     optValOutputLevel=1):
+    """
+    Write optimization output to Parquet files (one file per Excel sheet of writeOptimizationOutputToExcel,
+    snappy compressed). Requires the pyarrow python package.
+
+    :param esM: EnergySystemModel instance in which the optimized model is hold
+    :type esM: EnergySystemModel instance
+
+    :param outputFolderName: name of the folder in which the Parquet files are stored. The folder is created
+        if it does not exist.
+        |br| * the default value is 'scenarioOutput'
+    :type outputFolderName: string
+
+    :param optSumOutputLevel: output level of the optimization summary (see writeOptimizationOutputToExcel).
+        |br| * the default value is 2
+    :type optSumOutputLevel: int (0,1,2) or dict
+
+    :param optValOutputLevel: output level of the optimal values (see writeOptimizationOutputToExcel).
+        |br| * the default value is 1
+    :type optValOutputLevel: int (0,1) or dict
+    """
+    utils.output('\nWriting output to Parquet... ', esM.verbose, 0)
+    _t = time.time()
+    frames = getOptimizationOutputFrames(esM, optSumOutputLevel, optValOutputLevel)
+    utils.output('\tSaving files...', esM.verbose, 0)
+    writeFramesToParquet(frames, outputFolderName)
+    utils.output('Done. (%.4f' % (time.time() - _t) + ' sec)', esM.verbose, 0)
+
+
+def writeFramesToParquet(frames, outputFolderName='scenarioOutput'):
+    """
+    Write a list of (sheet name, DataFrame) tuples, as obtained by getOptimizationOutputFrames, to Parquet files.
+
+    :param frames: list of (sheet name, DataFrame) tuples
+    :type frames: list
+
+    :param outputFolderName: name of the folder in which the Parquet files are stored
+        |br| * the default value is 'scenarioOutput'
+    :type outputFolderName: string
+    """
+    os.makedirs(outputFolderName, exist_ok=True)
+    for sheetName, df in frames:
+        # Parquet requires string column names (time steps and periods are integers)
+        df = df.copy()
+        df.columns = [str(col) for col in df.columns]
+        df.to_parquet(os.path.join(outputFolderName, sheetName + '.parquet'), engine='pyarrow',
+                      compression='snappy')
+
+
 def readEnergySystemModelFromExcel(fileName='scenarioInput.xlsx'):
     """
     Read energy system model from excel file.
@@ -12,10 +12,31 @@ import pyomo.environ as pyomo
 import pyomo.opt as opt
 import time
 import warnings
+
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 
+def _aggregateTimeSeries(timeSeriesData, numberOfTypicalPeriods, hoursPerPeriod, clusterMethod, sortValues,
+                         weightDict, **kwargs):
+    """
+    Cluster the time series data with the tsam package. The function only depends on its arguments such that its
+    results can be cached (see the cacheDirectory argument of the EnergySystemModel's cluster function).
+
+    :return: TimeSeriesAggregation instance, clustered time series data (clusterPeriodDict)
+    """
+    clusterClass = TimeSeriesAggregation(timeSeries=timeSeriesData, noTypicalPeriods=numberOfTypicalPeriods,
+                                         hoursPerPeriod=hoursPerPeriod,
+                                         clusterMethod=clusterMethod, sortValues=sortValues, weightDict=weightDict,
+                                         **kwargs)
+    return clusterClass, clusterClass.clusterPeriodDict
+
+
 class EnergySystemModel:
     """
     EnergySystemModel class
@@ -243,6 +264,28 @@ class EnergySystemModel:
             raise TypeError('The added component has to inherit from the FINE class ComponentModel.')
         component.addToEnergySystemModel(self)
 
+    def addBatch(self, components):
+        """
+        Function for adding several components and, if required, their respective modeling classes to the
+        EnergySystemModel instance. All components are checked before the first one is added, such that either
+        all or none of the components are added. The components are then added with their addToEnergySystemModel
+        functions (as done by the add function).
+
+        :param components: the components to be added
+        :type components: list of objects which inherit from the FINE Component class
+        """
+        componentNames = dict(self.componentNames)
+        for component in components:
+            if not issubclass(type(component), Component):
+                raise TypeError('The added component has to inherit from the FINE class Component.')
+            if not issubclass(component.modelingClass, ComponentModel):
+                raise TypeError('The added component has to inherit from the FINE class ComponentModel.')
+            mdl = component.modelingClass.__name__
+            if componentNames.setdefault(component.name, mdl) != mdl:
+                raise ValueError('Component name ' + component.name + ' is not unique.')
+        for component in components:
+            component.addToEnergySystemModel(self)
+
     def removeComponent(self, componentName, track=False):
         """
         Function which removes a component from the energy system.
@@ -343,7 +386,7 @@ class EnergySystemModel:
             return df.loc[((df != 0) & (~df.isnull())).any(axis=1)]
 
     def cluster(self, numberOfTypicalPeriods=7, numberOfTimeStepsPerPeriod=24, clusterMethod='hierarchical',
-                sortValues=True, storeTSAinstance=False, **kwargs):
+                sortValues=True, storeTSAinstance=False, cacheDirectory=None, **kwargs):
         """
         Cluster the time series data of all components considered in the EnergySystemModel instance and then
         stores the clustered data in the respective components. For this, the time series data is broken down
@@ -386,6 +429,13 @@ class EnergySystemModel:
             |br| * the default value is False
         :type storeTSAinstance: boolean
 
+        :param cacheDirectory: if specified, the results of the tsam package are cached in this directory (requires
+            the joblib python package). If the clustering is called again with the same time series data, weights
+            and clustering parameters (e.g. in repeated runs of the myopic approach), the cached results are loaded
+            instead of clustering the time series data again.
+            |br| * the default value is None
+        :type cacheDirectory: string or None
+
         Last edited: August 10, 2018
         |br| @author: Lara Welder
         """
@@ -416,14 +466,18 @@ class EnergySystemModel:
         # Cluster data with tsam package (the reindex call is here for reproducibility of TimeSeriesAggregation
         # call)
         timeSeriesData = timeSeriesData.reindex(sorted(timeSeriesData.columns), axis=1)
-        clusterClass = TimeSeriesAggregation(timeSeries=timeSeriesData, noTypicalPeriods=numberOfTypicalPeriods,
-                                             hoursPerPeriod=hoursPerPeriod,
-                                             clusterMethod=clusterMethod, sortValues=sortValues, weightDict=weightDict,
-                                             **kwargs)
+        aggregateTimeSeries = _aggregateTimeSeries
+        if cacheDirectory is not None:
+            if joblib is None:
+                warnings.warn('The joblib python package could not be imported. The clustering results are not cached.')
+            else:
+                aggregateTimeSeries = joblib.Memory(cacheDirectory, verbose=0).cache(_aggregateTimeSeries)
+        clusterClass, clusterPeriodDict = aggregateTimeSeries(timeSeriesData, numberOfTypicalPeriods, hoursPerPeriod,
+                                                              clusterMethod, sortValues, weightDict, **kwargs)
 
         # Convert the clustered data to a pandas DataFrame and store the respective clustered time series data in the
         # associated components
-        data = pd.DataFrame.from_dict(clusterClass.clusterPeriodDict)
+        data = pd.DataFrame.from_dict(clusterPeriodDict)
         for mdlName, mdl in self.componentModelingDict.items():
             for compName, comp in mdl.componentsDict.items():
                 comp.setAggregatedTimeSeriesData(data)
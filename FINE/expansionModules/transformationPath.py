@@ -7,13 +7,176 @@ Last edited: February 11, 2020
 from FINE import utils
 from FINE.IOManagement import standardIO
 import pandas as pd 
+import numpy as np
+import pyomo.environ as pyomo
+from concurrent.futures import ThreadPoolExecutor
+import collections.abc
 import copy
+import functools
+import importlib.util
+import os
+import pickle
+import warnings
+
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the lifetime computations run as plain python functions
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _expireLifetime(lifetimes, nbOfRepresentedYears):
+    """
+    Reduce the lifetimes (float64 array) by the number of represented years and check if any lifetime is expired.
+
+    :return: reduced lifetimes, isExpired
+    :rtype: numpy array, boolean
+    """
+    out = np.empty_like(lifetimes)
+    isExpired = False
+    for i in range(lifetimes.size):
+        v = lifetimes[i] - nbOfRepresentedYears
+        out[i] = v
+        if v <= 0:
+            isExpired = True
+    return out, isExpired
+
+
+class _MyopicSnapshot(object):
+    """
+    Solution-only snapshot of an optimized EnergySystemModel instance which is stored for each optimization run
+    of the myopic approach instead of a deep copy of the entire model. It holds the optimization summaries, the
+    optimal values and the optimal capacities of all modeling classes as well as the names of the components
+    which were considered in the optimization run.
+    """
+    __slots__ = ('optSum', 'optVal', 'capacities', 'year', 'componentNames', 'verbose')
+
+    def __init__(self, esM, year):
+        """
+        Constructor for creating a _MyopicSnapshot instance
+
+        :param esM: optimized EnergySystemModel instance
+        :type esM: EnergySystemModel instance
+
+        :param year: year of the optimization run
+        :type year: int
+        """
+        def copyValues(values):
+            return values.copy(deep=True) if values is not None else None
+
+        self.year, self.verbose = year, esM.verbose
+        self.componentNames = dict(esM.componentNames)
+        self.optSum, self.optVal, self.capacities = {}, {}, {}
+        for mdl, mdlObj in esM.componentModelingDict.items():
+            self.optSum[mdl] = copyValues(mdlObj.optSummary)
+            self.optVal[mdl] = {key: dict(d, values=copyValues(d['values']))
+                                for key, d in mdlObj.getOptimalValues().items()}
+            self.capacities[mdl] = self.optVal[mdl]['capacityVariablesOptimum']['values']
+
+    def getOptimizationSummary(self, modelingClass, outputLevel=0):
+        """
+        Return the optimization summary of a modeling class (cf. EnergySystemModel.getOptimizationSummary).
+
+        :param modelingClass: name of the modeling class from which the optimization summary should be obtained
+        :type modelingClass: string
+
+        :param outputLevel: states the level of detail of the output summary (0, 1 or 2)
+            |br| * the default value is 0
+        :type outputLevel: integer (0, 1 or 2)
+
+        :returns: the optimization summary of the requested modeling class
+        :rtype: pandas DataFrame
+        """
+        if outputLevel == 0:
+            return self.optSum[modelingClass]
+        elif outputLevel == 1:
+            return self.optSum[modelingClass].dropna(how='all')
+        else:
+            if outputLevel != 2 and self.verbose < 2:
+                warnings.warn('Invalid input. An outputLevel parameter of 2 is assumed.')
+            df = self.optSum[modelingClass].dropna(how='all')
+            return df.loc[((df != 0) & (~df.isnull())).any(axis=1)]
+
+    def getOptimalValues(self, modelingClass, name='all'):
+        """
+        Return the optimal values of a modeling class (cf. ComponentModel.getOptimalValues).
+
+        :param modelingClass: name of the modeling class from which the optimal values should be obtained
+        :type modelingClass: string
+
+        :param name: name of the variables of which the optimal values should be returned
+            ('capacityVariablesOptimum', 'isBuiltVariablesOptimum', 'operationVariablesOptimum' or 'all')
+            |br| * the default value is 'all'
+        :type name: string
+        """
+        if name in self.optVal[modelingClass]:
+            return self.optVal[modelingClass][name]
+        return self.optVal[modelingClass]
+
+
+class MyopicResultsStore(collections.abc.MutableMapping):
+    """
+    Dictionary-like store for the results of the myopic approach, which writes each result to a file in a
+    directory (compressed with joblib if available, otherwise pickled) and only reads it again when it is accessed.
+    This avoids keeping the results of all optimization runs in memory.
+    """
+    def __init__(self, directory):
+        """
+        Constructor for creating a MyopicResultsStore instance
+
+        :param directory: directory in which the results are stored. It is created if it does not exist.
+        :type directory: string
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory, self._keys = directory, []
+
+    def _getFileName(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def __setitem__(self, key, value):
+        if joblib is not None:
+            joblib.dump(value, self._getFileName(key), compress=3)
+        else:
+            with open(self._getFileName(key), 'wb') as f:
+                pickle.dump(value, f)
+        if key not in self._keys:
+            self._keys.append(key)
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        if joblib is not None:
+            return joblib.load(self._getFileName(key))
+        with open(self._getFileName(key), 'rb') as f:
+            return pickle.load(f)
+
+    def __delitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        os.remove(self._getFileName(key))
+        self._keys.remove(key)
+
+    def __iter__(self):
+        return iter(list(self._keys))
+
+    def __len__(self):
+        return len(self._keys)
+
 
 def optimizeSimpleMyopic(esM, startYear, endYear=None, nbOfSteps=None, nbOfRepresentedYears=None,
                     timeSeriesAggregation=True, numberOfTypicalPeriods = 7, numberOfTimeStepsPerPeriod=24,
-                    logFileName='', threads=3, solver='gurobi', timeLimit=None, 
-                    optimizationSpecs='', warmstart=False, 
-                    CO2Reference=366, CO2ReductionTargets=None, saveResults=True, trackESMs=True):
+                    logFileName='', threads=None, solver='gurobi', timeLimit=None, 
+                    optimizationSpecs='', warmstart=True,
+                    CO2Reference=366, CO2ReductionTargets=None, saveResults=True, trackESMs=True,
+                    exportFormat='excel', writeOptimizationOutputFast=True, trackingDirectory=None,
+                    clusterCacheDirectory=None, concurrentLP=True, concurrentMIP=1, concurrentJobs=0):
     """
     Optimization function for myopic approach. For each optimization run, the newly installed capacities
     will be given as a stock (with capacityFix) to the next optimization run.
@@ -57,6 +220,32 @@ def optimizeSimpleMyopic(esM, startYear, endYear=None, nbOfSteps=None, nbOfRepre
         |br| * the default value is 24
     :type numberOfTimeStepsPerPeriod: strictly positive integer
 
+    :param clusterCacheDirectory: if specified, the clustering results are cached in this directory (cf. the
+        cacheDirectory argument of the EnergySystemModel's cluster function), such that repeated calls of
+        optimizeSimpleMyopic with the same time series data (e.g. for different CO2 reduction targets) do
+        not cluster the time series data again. Requires the joblib python package.
+        |br| * the default value is None
+    :type clusterCacheDirectory: string or None
+
+    :param threads: number of computational threads used for solving the optimization (solver dependent
+        input) if gurobi is used as the solver. A value of 0 results in using all available threads. If None,
+        the number of available CPUs (at most 32) is used.
+        |br| * the default value is None
+    :type threads: positive integer or None
+
+    :param solver: specifies which solver should solve the optimization problem (which of course has to be
+        installed on the machine on which the model is run).
+        |br| * the default value is 'gurobi'
+    :type solver: string
+
+    :param warmstart: specifies if the optimal values of the design variables (capacities and binary design
+        decisions) of the previous optimization run should be used as a warm start for the next optimization run
+        (not always supported by the solvers). The values are only given to the variables which exist in both
+        optimization runs. Note: if gurobi is used as the solver, a start file is written for every optimization
+        run, which gurobi ignores for pure LPs (i.e. if the model has no binary or integer design variables).
+        |br| * the default value is True
+    :type warmstart: boolean
+
     :param CO2Reference: gives the reference value of the CO2 emission to which the reduction should be applied to.
         The default value refers to the emissions of 1990 within the electricity sector (366kt CO2_eq)
         |br| * the default value is 366
@@ -72,57 +261,187 @@ def optimizeSimpleMyopic(esM, startYear, endYear=None, nbOfSteps=None, nbOfRepre
         |br| * the default value is True 
     :type saveResults: boolean
 
-    :param trackESMs: specifies if the energy system model instances of each model run should be stored in a dictionary or not. 
-        It´s not recommended to track the ESMs if the model is quite big. 
+    :param trackESMs: specifies if the results of each model run should be stored in a dictionary or not. 
+        Only the optimization summaries, optimal values and component names are stored (no copy of the entire
+        energy system model instance). 
         |br| * the default value is True
     :type trackESMs: boolean
 
+    :param exportFormat: specifies the format in which the results are saved if saveResults is True:
+        - 'excel': one Excel file per optimization run (ESM<year>.xlsx).
+        - 'parquet': one folder per optimization run (ESM<year>) with one Parquet file per output table.
+          Requires the pyarrow python package.
+        - 'none': no results are saved (same as saveResults=False).
+        Note: 'excel' is kept as the default such that existing scripts still obtain their Excel files.
+        Use 'parquet' or 'none' to skip the (slower) Excel export.
+        |br| * the default value is 'excel'
+    :type exportFormat: string ('excel', 'parquet' or 'none')
+
+    :param writeOptimizationOutputFast: specifies if the Excel files are written with a write-only workbook
+        (cf. writeOptimizationOutputToExcel), which is considerably faster for large models.
+        |br| * the default value is True
+    :type writeOptimizationOutputFast: boolean
+
+    :param trackingDirectory: if specified, the results of each model run are not kept in memory but written to
+        this directory (one compressed pickle file per optimization run) and only loaded when they are accessed
+        (cf. MyopicResultsStore). Only considered if trackESMs is True.
+        |br| * the default value is None
+    :type trackingDirectory: string or None
+
+    :param concurrentLP: specifies if the deterministic concurrent optimizer of gurobi should be used (Method=4),
+        i.e. if primal simplex, dual simplex and barrier are run in parallel for solving the LP (or the root
+        relaxation of a MILP) and the first algorithm which finishes is taken (with reproducible results).
+        Only considered if gurobi is used as the solver and no Method is given in the optimizationSpecs.
+        |br| * the default value is True
+    :type concurrentLP: boolean
+
+    :param concurrentMIP: number of independent MILP solves with different solver settings which gurobi
+        performs in parallel (ConcurrentMIP parameter). Only considered if gurobi is used as the solver.
+        |br| * the default value is 1
+    :type concurrentMIP: strictly positive integer
+
+    :param concurrentJobs: number of distributed concurrent jobs (ConcurrentJobs parameter, requires a
+        distributed gurobi setup). A value of 0 disables distributed concurrent optimization.
+        |br| * the default value is 0
+    :type concurrentJobs: nonnegative integer
+
     **Returns:**
 
     :returns myopicResults: Store all optimization outputs in a dictionary for further analyses. If trackESMs is set to false,
-        nothing is returned.
-    :rtype myopicResults: dict of all optimized instances of the EnergySystemModel class or None.
+        nothing is returned. Each entry provides the attribute componentNames and the functions getOptimizationSummary
+        and getOptimalValues of the optimized model run.
+    :rtype myopicResults: dict (or MyopicResultsStore if a trackingDirectory is given) of solution snapshots of all
+        optimized EnergySystemModel instances or None.
 
     Last edited: February 14, 2020
     |br| @author: Theresa Gross, Felix Kullmann
     """                              
                 
+    # Note: all input checks are done once before the optimization runs
     nbOfSteps, nbOfRepresentedYears = utils.checkAndSetTimeHorizon(startYear, endYear, nbOfSteps, nbOfRepresentedYears)
-    utils.checkSinkCompCO2toEnvironment(esM, CO2ReductionTargets)
+    CO2ReductionTargets = utils.checkSinkCompCO2toEnvironment(esM, CO2ReductionTargets)
     utils.checkCO2ReductionTargets(CO2ReductionTargets, nbOfSteps)
+    # Yearly CO2 limits of all optimization runs (cf. utils.setNewCO2ReductionTarget)
+    if CO2ReductionTargets is not None:
+        CO2Limits = CO2Reference*(1-np.asarray(CO2ReductionTargets, dtype=np.float64)/100)
+    if exportFormat not in ['excel', 'parquet', 'none']:
+        raise ValueError("exportFormat has to be 'excel', 'parquet' or 'none'.")
+    if saveResults and exportFormat == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        raise ImportError("The pyarrow python package is required for exportFormat='parquet'.")
+    if threads is None:
+        threads = min(32, os.cpu_count() or 1)
+    optimizationSpecs = utils.setConcurrentOptimizationSpecs(solver, optimizationSpecs, concurrentLP, concurrentMIP,
+                                                             concurrentJobs)
     print('Number of optimization runs: ', nbOfSteps+1)
     print('Number of years represented by one optimization: ', nbOfRepresentedYears)
     mileStoneYear = startYear
     if trackESMs:
-        myopicResults = dict()
+        myopicResults = dict() if trackingDirectory is None else MyopicResultsStore(trackingDirectory)
+
+    # The time series data is clustered only once. The stock components added by getStock are copies of already
+    # clustered components and keep their aggregated time series data, so getStock keeps the cluster flag set.
+    if timeSeriesAggregation:
+        esM.cluster(numberOfTypicalPeriods=numberOfTypicalPeriods,
+                    numberOfTimeStepsPerPeriod=numberOfTimeStepsPerPeriod, cacheDirectory=clusterCacheDirectory)
+
+    # The solver arguments are the same for all optimization runs (getStock returns the same esM instance)
+    optimize = functools.partial(esM.optimize, declaresOptimizationProblem=False,
+                                 timeSeriesAggregation=timeSeriesAggregation, threads=threads, solver=solver,
+                                 timeLimit=timeLimit, optimizationSpecs=optimizationSpecs, warmstart=warmstart)
+
+    pendingWrites = []
+    previousSolution = None
 
-    for step in range(0,nbOfSteps+1):
-        mileStoneYear = startYear + step*nbOfRepresentedYears
-        logFileName = 'log_'+str(mileStoneYear)
-        utils.setNewCO2ReductionTarget(esM,CO2Reference,CO2ReductionTargets,step)
+    # The results are written to file in a background thread (see below). Leaving the with statement waits for
+    # all pending writes and shuts down the thread, also if an error occurs in one of the optimization runs.
+    with ThreadPoolExecutor(max_workers=1) as ioPool:
+        for step in range(0,nbOfSteps+1):
+            mileStoneYear = startYear + step*nbOfRepresentedYears
+            logFileName = 'log_'+str(mileStoneYear)
+            if CO2ReductionTargets is not None:
+                esM.getComponent('CO2 to environment').yearlyLimit = float(CO2Limits[step])
 
-        # Optimization
-        if timeSeriesAggregation:
-            esM.cluster(numberOfTypicalPeriods=numberOfTypicalPeriods, numberOfTimeStepsPerPeriod=numberOfTimeStepsPerPeriod)
+            # Optimization (re-cluster only if components with new time series data were added in the meantime)
+            if timeSeriesAggregation and not esM.isTimeSeriesDataClustered:
+                esM.cluster(numberOfTypicalPeriods=numberOfTypicalPeriods,
+                            numberOfTimeStepsPerPeriod=numberOfTimeStepsPerPeriod,
+                            cacheDirectory=clusterCacheDirectory)
 
-        esM.optimize(declaresOptimizationProblem=True, timeSeriesAggregation=timeSeriesAggregation, 
-                        logFileName=logFileName, threads=threads, solver=solver, timeLimit=timeLimit, 
-                        optimizationSpecs=optimizationSpecs, warmstart=False)
+            # If warmstart is True, the optimal values of the previous optimization run are given as start values
+            # for the variables which also exist in the current optimization run.
+            esM.declareOptimizationProblem(timeSeriesAggregation=timeSeriesAggregation)
+            if warmstart and previousSolution is not None:
+                _setVariableValues(esM.pyM, previousSolution)
+
+            optimize(logFileName=logFileName)
+
+            if warmstart:
+                previousSolution = _getVariableValues(esM.pyM)
         
-        if saveResults:
-            standardIO.writeOptimizationOutputToExcel(esM, outputFileName='ESM'+str(mileStoneYear), optSumOutputLevel=2, optValOutputLevel=1)
+            # The output tables are collected here, but written to file in a background thread such that the
+            # writing overlaps with the preparation and solving of the next optimization run.
+            if saveResults and exportFormat != 'none':
+                frames = standardIO.getOptimizationOutputFrames(esM, optSumOutputLevel=2, optValOutputLevel=1)
+                if exportFormat == 'excel':
+                    pendingWrites.append(ioPool.submit(standardIO.writeFramesToExcel, frames, 'ESM'+str(mileStoneYear),
+                                                       writeOnly=writeOptimizationOutputFast))
+                else:
+                    pendingWrites.append(ioPool.submit(standardIO.writeFramesToParquet, frames,
+                                                       'ESM'+str(mileStoneYear)))
+
+            if trackESMs:
+                myopicResults['ESM_'+str(mileStoneYear)] = _MyopicSnapshot(esM, mileStoneYear)
 
-        if trackESMs:
-            myopicResults.update({'ESM_'+str(mileStoneYear): copy.deepcopy(esM)})
+            # Get stock if not all optimizations are done
+            if step != nbOfSteps+1:
+                esM = getStock(esM, mileStoneYear, nbOfRepresentedYears)
+
+        # Wait until all results are written (and raise errors which occurred while writing)
+        for future in pendingWrites:
+            future.result()
 
-        # Get stock if not all optimizations are done
-        if step != nbOfSteps+1:
-            esM = getStock(esM, mileStoneYear, nbOfRepresentedYears)
     if trackESMs:
         return myopicResults
     else:
         return None
 
+def _getTechnicalLifetimeArray(comp):
+    """
+    Return the technical lifetime of a component as a contiguous float64 array. The array is cached in the component
+    and only computed again if the technicalLifetime attribute of the component is replaced.
+    """
+    cached = getattr(comp, '_technicalLifetimeArray', None)
+    if cached is None or cached[0] is not comp.technicalLifetime:
+        cached = (comp.technicalLifetime, np.ascontiguousarray(comp.technicalLifetime, dtype=np.float64))
+        comp._technicalLifetimeArray = cached
+    return cached[1]
+
+# Prefixes of the design variables (capacities and binary design decisions) which are used for a warm start
+_WARMSTART_VARIABLES = ('cap_', 'nbReal_', 'nbInt_', 'designBin_')
+
+def _getWarmstartVariables(pyM):
+    """ Return the design variables of a pyomo ConcreteModel instance which are used for a warm start. """
+    return [var for var in pyM.component_objects(pyomo.Var) if var.local_name.startswith(_WARMSTART_VARIABLES)]
+
+def _getVariableValues(pyM):
+    """
+    Return the values of the design variables of a pyomo ConcreteModel instance which have a value as a dictionary
+    ((variable name, index): value).
+    """
+    return {(var.local_name, index): varData.value for var in _getWarmstartVariables(pyM)
+            for index, varData in var.items() if varData.value is not None}
+
+def _setVariableValues(pyM, values):
+    """
+    Set the values of the design variables of a pyomo ConcreteModel instance which are given in the values
+    dictionary ((variable name, index): value). Values which do not fit the domain of a variable are ignored.
+    """
+    for var in _getWarmstartVariables(pyM):
+        for index, varData in var.items():
+            value = values.get((var.local_name, index))
+            if value is not None and value in varData.domain:
+                varData.set_value(value)
+
 def getStock(esM, mileStoneYear, nbOfRepresentedYears):
     '''
     Function for determining the stock of all considered technologies for the next optimization period. 
@@ -140,33 +459,60 @@ def getStock(esM, mileStoneYear, nbOfRepresentedYears):
     Last edited: February 11, 2020
     |br| @author: Theresa Gross, Felix Kullmann
     ''' 
-    for mdl in esM.componentModelingDict.keys():
-        compValues = esM.componentModelingDict[mdl].getOptimalValues('capacityVariablesOptimum')['values']
-        if compValues is not None:
-            for comp in compValues.index.get_level_values(0).unique():
-                if 'stock' not in esM.componentModelingDict[mdl].componentsDict[comp].name:
-                    stockName = comp+'_stock'+'_'+str(mileStoneYear)
-                    stockComp = copy.deepcopy(esM.componentModelingDict[mdl].componentsDict[comp])
-                    stockComp.name = stockName
-                    stockComp.lifetime = esM.componentModelingDict[mdl].componentsDict[comp].technicalLifetime - nbOfRepresentedYears
-                    # If lifetime is shorter than number of represented years, skip component
-                    if any(getattr(stockComp,'lifetime') <= 0):
-                        continue
-
-                    # If capacities are installed, set the values as capacityFix.
-                    if getattr(stockComp, 'capacityFix') is None:
-                        if isinstance(compValues.loc[comp], pd.DataFrame):
-                            stockComp.capacityFix = utils.preprocess2dimData(compValues.loc[comp].fillna(value=-1), discard=False)
-                        else:
+    # The stock components are copies of the existing components including their aggregated time series data.
+    # Hence, adding them does not invalidate an existing clustering of the time series data.
+    isTimeSeriesDataClustered = esM.isTimeSeriesDataClustered
+    # The new stock components are added after all modeling classes are processed
+    newStockComps = []
+    # Note: list() is required as removeComponent deletes modeling classes without components
+    for mdl, mdlObj in list(esM.componentModelingDict.items()):
+        compsDict = mdlObj.componentsDict
+        compValues = mdlObj.getOptimalValues('capacityVariablesOptimum')['values']
+        if compValues is None:
+            continue
+        # For 2dim components, the capacities are given as a DataFrame per component (fill NaN values only once)
+        if isinstance(compValues.index, pd.MultiIndex):
+            filledCompValues = compValues.fillna(value=-1)
+            compNames = compValues.index.remove_unused_levels().levels[0]
+        else:
+            filledCompValues, compNames = None, compValues.index.unique()
+        for comp in compNames:
+            c = compsDict[comp]
+            isStock = 'stock' in c.name
+            if not isStock:
+                technicalLifetime = c.technicalLifetime
+                lifetime, isExpired = _expireLifetime(_getTechnicalLifetimeArray(c), nbOfRepresentedYears)
+                # If lifetime is shorter than number of represented years, skip component (before copying it)
+                if isExpired:
+                    continue
+
+                stockName = comp+'_stock'+'_'+str(mileStoneYear)
+                # A shallow copy suffices as the attributes of a component (e.g. its time series data) are only
+                # re-assigned and never modified in place. The stock component hence shares them with its parent.
+                stockComp = copy.copy(c)
+                stockComp.name = stockName
+                stockComp.lifetime = pd.Series(lifetime, index=technicalLifetime.index)
+
+                # If capacities are installed, set the values as capacityFix.
+                if stockComp.capacityFix is None:
+                    compCapacity = compValues.loc[comp]
+                    if isinstance(compCapacity, pd.DataFrame):
+                        stockComp.capacityFix = utils.preprocess2dimData(filledCompValues.loc[comp], discard=False)
+                    else:
 # NOTE: Values of capacityMin and capacityMax are not overwritten. 
 # CapacityFix values set the capacity fix and fulfills the boundary constraints (capacityMin <= capacityFix <= capacityMax)
-                            stockComp.capacityFix = compValues.loc[comp]
-                    esM.add(stockComp)
+                        stockComp.capacityFix = compCapacity
+                newStockComps.append(stockComp)
 
-                elif 'stock' in esM.componentModelingDict[mdl].componentsDict[comp].name:
-                    esM.componentModelingDict[mdl].componentsDict[comp].lifetime -= nbOfRepresentedYears
-                    # If lifetime is exceeded, remove component from the energySystemModel instance
-                    if any(getattr(esM.componentModelingDict[mdl].componentsDict[comp],'lifetime') <= 0):
-                        esM.removeComponent(comp)
+            else:
+                stockLifetime = c.lifetime
+                lifetime, isExpired = _expireLifetime(np.asarray(stockLifetime, dtype=np.float64),
+                                                      nbOfRepresentedYears)
+                c.lifetime = pd.Series(lifetime, index=stockLifetime.index)
+                # If lifetime is exceeded, remove component from the energySystemModel instance
+                if isExpired:
+                    esM.removeComponent(comp)
 
+    esM.addBatch(newStockComps)
+    esM.isTimeSeriesDataClustered = isTimeSeriesDataClustered
     return esM
\ No newline at end of file
@@ -847,17 +847,10 @@ def setOptimalComponentVariables(optVal, varType, compDict):
 def preprocess2dimData(data, mapC=None, locationalEligibility=None, discard=True):
     if data is not None and isinstance(data, pd.DataFrame):
         if mapC is None:
-            index, data_ = [], []
-            for loc1 in data.columns:
-                for loc2 in data.index:
-                    if discard:
-                        # Structure: data[column][row]
-                        if data[loc1][loc2] > 0:
-                            index.append(loc1 + '_' + loc2), data_.append(data[loc1][loc2])
-                    else:
-                        if data[loc1][loc2] >= 0:
-                            index.append(loc1 + '_' + loc2), data_.append(data[loc1][loc2])
-            return pd.Series(data_, index=index)
+            # Structure: data[column][row], the stacked data is ordered by columns first and rows second
+            stackedData = data.T.stack()
+            stackedData = stackedData[stackedData > 0] if discard else stackedData[stackedData >= 0]
+            return pd.Series(stackedData.values, index=[loc1 + '_' + loc2 for loc1, loc2 in stackedData.index])
         else:
             return pd.Series(mapC).apply(lambda loc: data[loc[0]][loc[1]])
     elif isinstance(data, float) and locationalEligibility is not None:
@@ -1114,3 +1107,33 @@ def setNewCO2ReductionTarget(esM, CO2Reference, CO2ReductionTargets, step):
         setattr(esM.componentModelingDict['SourceSinkModel'].componentsDict['CO2 to environment'], 'yearlyLimit', CO2Reference*(1-CO2ReductionTargets[step]/100))
 
  
+
+def setConcurrentOptimizationSpecs(solver, optimizationSpecs, concurrentLP, concurrentMIP, concurrentJobs):
+    """
+    If gurobi is used as the solver, add the parameters of the concurrent optimizer to the optimizationSpecs.
+    Parameters which are already given in the optimizationSpecs (gurobi parameter names are case-insensitive)
+    are not overwritten.
+    """
+    if not isinstance(concurrentLP, bool):
+        raise TypeError('The concurrentLP parameter has to be a boolean.')
+    if not isinstance(concurrentMIP, int):
+        raise TypeError('The concurrentMIP parameter has to be an integer.')
+    if concurrentMIP < 1:
+        raise ValueError('The concurrentMIP parameter has to be a strictly positive integer.')
+    if not isinstance(concurrentJobs, int):
+        raise TypeError('The concurrentJobs parameter has to be an integer.')
+    if concurrentJobs < 0:
+        raise ValueError('The concurrentJobs parameter has to be a nonnegative integer.')
+
+    if solver != 'gurobi':
+        return optimizationSpecs
+    givenParameters = [spec.split('=')[0].strip().lower() for spec in optimizationSpecs.split() if '=' in spec]
+    specs = [optimizationSpecs] if optimizationSpecs else []
+    # Method=4 is gurobi's deterministic concurrent optimizer
+    if concurrentLP and 'method' not in givenParameters:
+        specs.append('Method=4')
+    if concurrentMIP > 1 and 'concurrentmip' not in givenParameters:
+        specs.append('ConcurrentMIP=' + str(concurrentMIP))
+    if concurrentJobs > 0 and 'concurrentjobs' not in givenParameters:
+        specs.append('ConcurrentJobs=' + str(concurrentJobs))
+    return ' '.join(specs)
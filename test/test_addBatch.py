@@ -0,0 +1,59 @@
+import pytest
+import FINE as fn
+
+
+def test_addBatch(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.cluster(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1)
+    componentNames = dict(esM.componentNames)
+
+    # An empty list does not change the model
+    esM.addBatch([])
+    assert esM.componentNames == componentNames
+    assert esM.isTimeSeriesDataClustered
+
+    # The components are added like with the add function
+    components = [fn.Source(esM=esM, name='New source', commodity='electricity', hasCapacityVariable=False),
+                  fn.Sink(esM=esM, name='New sink', commodity='hydrogen', hasCapacityVariable=False)]
+    esM.addBatch(components)
+    assert esM.componentNames['New source'] == 'SourceSinkModel'
+    assert esM.componentNames['New sink'] == 'SourceSinkModel'
+    assert esM.getComponent('New source') is components[0]
+    assert esM.getComponent('New sink') is components[1]
+    assert not esM.isTimeSeriesDataClustered
+
+
+def test_addBatchNewModelingClass():
+    esM = fn.EnergySystemModel(locations={'location'}, commodities={'electricity'}, numberOfTimeSteps=4,
+                               commodityUnitsDict={'electricity': r'kW$_{el}$'}, hoursPerTimeStep=2190,
+                               costUnit='1 Euro', lengthUnit='km', verboseLogLevel=2)
+
+    esM.addBatch([fn.Source(esM=esM, name='Source', commodity='electricity', hasCapacityVariable=False),
+                  fn.Storage(esM=esM, name='Storage', commodity='electricity')])
+    assert set(esM.componentModelingDict.keys()) == {'SourceSinkModel', 'StorageModel'}
+    assert list(esM.componentModelingDict['StorageModel'].componentsDict.keys()) == ['Storage']
+
+
+def test_addBatchAllOrNothing(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.cluster(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1)
+    componentNames = dict(esM.componentNames)
+    source = fn.Source(esM=esM, name='New source', commodity='electricity', hasCapacityVariable=False)
+
+    # Invalid component
+    with pytest.raises(TypeError):
+        esM.addBatch([source, 'New sink'])
+
+    # Name of a component of another modeling class in the model
+    with pytest.raises(ValueError):
+        esM.addBatch([source, fn.Source(esM=esM, name='Electrolyzers', commodity='electricity',
+                                        hasCapacityVariable=False)])
+
+    # Name of a component of another modeling class in the batch
+    with pytest.raises(ValueError):
+        esM.addBatch([source, fn.Storage(esM=esM, name='New source', commodity='electricity')])
+
+    # None of the components are added
+    assert esM.componentNames == componentNames
+    assert 'New source' not in esM.componentModelingDict['SourceSinkModel'].componentsDict
+    assert esM.isTimeSeriesDataClustered
@@ -0,0 +1,19 @@
+import pytest
+import numpy as np
+
+
+def test_clusterCache(minimal_test_esM, tmp_path, monkeypatch):
+    pytest.importorskip('joblib')
+
+    esM = minimal_test_esM
+    esM.cluster(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1, cacheDirectory=str(tmp_path))
+    periodsOrder = np.array(esM.periodsOrder)
+
+    # The second clustering with the same data and parameters has to be loaded from the cache (tsam is not called)
+    def timeSeriesAggregation(*args, **kwargs):
+        raise AssertionError('The clustering results were not loaded from the cache.')
+    monkeypatch.setattr('FINE.energySystemModel.TimeSeriesAggregation', timeSeriesAggregation)
+
+    esM.cluster(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1, cacheDirectory=str(tmp_path))
+    assert esM.isTimeSeriesDataClustered
+    assert np.array_equal(np.array(esM.periodsOrder), periodsOrder)
@@ -0,0 +1,31 @@
+import pytest
+import FINE as fn
+
+
+def test_setConcurrentOptimizationSpecs():
+    setSpecs = fn.utils.setConcurrentOptimizationSpecs
+
+    # The deterministic concurrent optimizer is added to the given specs
+    assert setSpecs('gurobi', '', True, 1, 0) == 'Method=4'
+    assert setSpecs('gurobi', 'OptimalityTol=1e-3', True, 2, 3) == \
+        'OptimalityTol=1e-3 Method=4 ConcurrentMIP=2 ConcurrentJobs=3'
+    assert setSpecs('gurobi', 'OptimalityTol=1e-3', False, 1, 0) == 'OptimalityTol=1e-3'
+
+    # Given parameters are not overwritten (gurobi parameter names are case-insensitive)
+    assert setSpecs('gurobi', 'method=2', True, 1, 0) == 'method=2'
+    assert setSpecs('gurobi', 'METHOD=2 concurrentMIP=3', True, 2, 0) == 'METHOD=2 concurrentMIP=3'
+
+    # Parameters which only contain the name of a given parameter do not count as given
+    assert setSpecs('gurobi', 'NodeMethod=1', True, 1, 0) == 'NodeMethod=1 Method=4'
+
+    # The specs are not changed for other solvers
+    assert setSpecs('glpk', '', True, 2, 3) == ''
+    assert setSpecs('cplex', 'threads=4', True, 1, 0) == 'threads=4'
+
+    # Invalid inputs
+    with pytest.raises(TypeError):
+        setSpecs('gurobi', '', 1, 1, 0)
+    with pytest.raises(ValueError):
+        setSpecs('gurobi', '', True, 0, 0)
+    with pytest.raises(ValueError):
+        setSpecs('gurobi', '', True, 1, -1)
@@ -0,0 +1,24 @@
+import FINE as fn
+import numpy as np
+import pandas as pd
+
+
+def test_preprocess2dimData():
+    # Structure: data[column][row], i.e. the value of the connection loc1_loc2 is data.loc[loc2, loc1]
+    data = pd.DataFrame([[0., 2., np.nan],
+                         [1., 0., 3.],
+                         [np.nan, 4., -1.]],
+                        index=['a', 'b', 'c'], columns=['a', 'b', 'c'])
+
+    # discard=True: only strictly positive values are kept (NaN values are dropped)
+    expected = pd.Series([1., 2., 4., 3.], index=['a_b', 'b_a', 'b_c', 'c_b'])
+    result = fn.utils.preprocess2dimData(data, discard=True)
+    pd.testing.assert_series_equal(result, expected)
+
+    # discard=False: zeros are kept as well (NaN and negative values are dropped)
+    expected = pd.Series([0., 1., 2., 0., 4., 3.], index=['a_a', 'a_b', 'b_a', 'b_b', 'b_c', 'c_b'])
+    result = fn.utils.preprocess2dimData(data, discard=False)
+    pd.testing.assert_series_equal(result, expected)
+
+    # Data which is not a DataFrame is returned unchanged
+    assert fn.utils.preprocess2dimData(None) is None
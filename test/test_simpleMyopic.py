@@ -189,3 +189,19 @@ def test_CO2ReductionTargets():
     assert results['ESM_2025'].getOptimizationSummary('SourceSinkModel').loc['CO2 to environment'].loc['operation'].values.sum() < 183
 
     assert results['ESM_2030'].getOptimizationSummary('SourceSinkModel').loc['CO2 to environment'].loc['operation'].values.sum() == 0
+
+
+def test_trackingDirectory(minimal_test_esM, tmp_path):
+    esM = minimal_test_esM
+    trackingDirectory = str(tmp_path / 'myopicResults')
+
+    results = fn.optimizeSimpleMyopic(esM, startYear=2020, nbOfSteps=1, nbOfRepresentedYears=5, 
+                                        timeSeriesAggregation=False, solver='glpk', saveResults=False, 
+                                        trackESMs=True, trackingDirectory=trackingDirectory)
+
+    # The results are stored in the tracking directory and loaded when they are accessed
+    assert isinstance(results, fn.MyopicResultsStore)
+    assert list(results.keys()) == ['ESM_2020', 'ESM_2025']
+    assert (tmp_path / 'myopicResults' / 'ESM_2020.pkl').exists()
+    assert 'Electrolyzers_stock_2020' in results['ESM_2025'].componentNames.keys()
+    assert not results['ESM_2025'].getOptimizationSummary('ConversionModel', outputLevel=2).empty
@@ -0,0 +1,39 @@
+import pyomo.environ as pyomo
+
+from FINE.expansionModules.transformationPath import _getVariableValues, _setVariableValues
+
+
+def test_warmstartVariableValues():
+    # Model of the previous optimization run
+    previousModel = pyomo.ConcreteModel()
+    previousModel.cap_conv = pyomo.Var(['a', 'b'], domain=pyomo.NonNegativeReals)
+    previousModel.designBin_conv = pyomo.Var(['a', 'b'], domain=pyomo.Binary)
+    previousModel.op_conv = pyomo.Var(['a'], domain=pyomo.NonNegativeReals)
+    previousModel.cap_conv['a'].value = 2.
+    previousModel.cap_conv['b'].value = 3.
+    previousModel.designBin_conv['a'].value = 1
+
+    # Only the design variables which have a value are returned
+    values = _getVariableValues(previousModel)
+    assert values == {('cap_conv', 'a'): 2., ('cap_conv', 'b'): 3., ('designBin_conv', 'a'): 1}
+
+    # Model of the next optimization run (with a new index 'c')
+    model = pyomo.ConcreteModel()
+    model.cap_conv = pyomo.Var(['a', 'c'], domain=pyomo.NonNegativeReals)
+    model.designBin_conv = pyomo.Var(['a'], domain=pyomo.Binary)
+
+    # Values which do not fit the domain of a variable are ignored
+    values[('cap_conv', 'a')] = -1.
+    values[('designBin_conv', 'a')] = 0.5
+    _setVariableValues(model, values)
+    assert model.cap_conv['a'].value is None
+    assert model.cap_conv['c'].value is None
+    assert model.designBin_conv['a'].value is None
+
+    # Values of matching (variable name, index) pairs are copied
+    values[('cap_conv', 'a')] = 2.
+    values[('designBin_conv', 'a')] = 1
+    _setVariableValues(model, values)
+    assert model.cap_conv['a'].value == 2.
+    assert model.cap_conv['c'].value is None
+    assert model.designBin_conv['a'].value == 1
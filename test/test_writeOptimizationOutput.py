@@ -0,0 +1,61 @@
+import pytest
+import FINE as fn
+import numpy as np
+import pandas as pd
+
+
+def test_writeOptimizationOutputWriteOnly(minimal_test_esM, tmp_path):
+    esM = minimal_test_esM
+    esM.optimize(solver='glpk')
+    optSum = esM.getOptimizationSummary('ConversionModel', outputLevel=2).astype(float)
+
+    # Write the output with a write-only workbook and read it back
+    outputFileName = str(tmp_path / 'writeOnlyOutput')
+    fn.writeOptimizationOutputToExcel(esM, outputFileName=outputFileName, writeOnly=True)
+    esM = fn.readOptimizationOutputFromExcel(esM, fileName=outputFileName + '.xlsx')
+
+    readOptSum = esM.componentModelingDict['ConversionModel'].optSummary
+    assert np.allclose(readOptSum.loc[optSum.index, optSum.columns].values.astype(float), optSum.values, 
+                       equal_nan=True)
+
+
+def test_writeOptimizationOutputToParquet(minimal_test_esM, tmp_path):
+    pytest.importorskip('pyarrow')
+
+    esM = minimal_test_esM
+    esM.optimize(solver='glpk')
+    optSum = esM.getOptimizationSummary('ConversionModel', outputLevel=2).astype(float)
+
+    outputFolderName = str(tmp_path / 'parquetOutput')
+    fn.writeOptimizationOutputToParquet(esM, outputFolderName=outputFolderName)
+
+    readOptSum = pd.read_parquet(str(tmp_path / 'parquetOutput' / 'ConversionOptSummary_1dim.parquet'))
+    assert np.allclose(readOptSum.loc[optSum.index, optSum.columns].values.astype(float), optSum.values, 
+                       equal_nan=True)
+
+
+def test_exportFormatParquet(minimal_test_esM, tmp_path, monkeypatch):
+    pytest.importorskip('pyarrow')
+    monkeypatch.chdir(tmp_path)
+
+    fn.optimizeSimpleMyopic(minimal_test_esM, startYear=2020, nbOfSteps=1, nbOfRepresentedYears=5, 
+                            timeSeriesAggregation=False, solver='glpk', saveResults=True, trackESMs=False, 
+                            exportFormat='parquet')
+
+    for year in [2020, 2025]:
+        assert (tmp_path / ('ESM' + str(year)) / 'ConversionOptSummary_1dim.parquet').exists()
+        assert not (tmp_path / ('ESM' + str(year) + '.xlsx')).exists()
+
+
+def test_writeOnlyHeader(tmp_path):
+    # The header of the write-only workbook equals the one written by pandas' to_excel
+    frames = [('Unnamed', pd.DataFrame({'a': [1., np.nan]}, index=['x', 'y'])),
+              ('Named', pd.DataFrame({'a': [1., 2.]}, index=pd.MultiIndex.from_tuples(
+                  [('x', 'u'), ('y', 'v')], names=['first', None])))]
+    fn.IOManagement.standardIO.writeFramesToExcel(frames, str(tmp_path / 'pandas'), writeOnly=False)
+    fn.IOManagement.standardIO.writeFramesToExcel(frames, str(tmp_path / 'writeOnly'), writeOnly=True)
+
+    for sheetName, _ in frames:
+        expected = pd.read_excel(str(tmp_path / 'pandas.xlsx'), sheet_name=sheetName, header=None, nrows=1)
+        result = pd.read_excel(str(tmp_path / 'writeOnly.xlsx'), sheet_name=sheetName, header=None, nrows=1)
+        assert result.equals(expected)